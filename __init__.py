@@ -4,15 +4,18 @@ Agent evaluation package for banking multi-agent routing.
 from .backend import (
     build_agents,
     get_conversation_id,
+    get_conversation_id_cached,
     extract_routed_agent_name,
     extract_tool_calls,
     transfer_funds,
     pay_bill,
     update_account_info,
+    get_shared_client,
+    close_shared_client,
     run_handoff_eval,
     run_tool_eval,
 )
-from .data import RoutingCase, ROUTING_DATASET, ToolCallCase, TOOL_CALL_DATASET
+from .data import RoutingCase, ToolCallCase
 from .frontend import app
 
 __all__ = [
@@ -22,13 +25,23 @@ __all__ = [
     "ToolCallCase",
     "TOOL_CALL_DATASET",
     "get_conversation_id",
+    "get_conversation_id_cached",
     "extract_routed_agent_name",
     "extract_tool_calls",
     "transfer_funds",
     "pay_bill",
     "update_account_info",
+    "get_shared_client",
+    "close_shared_client",
     "run_handoff_eval",
     "run_tool_eval",
     "app",
 ]
 
+
+def __getattr__(name: str):
+    # Datasets are loaded on first access
+    if name in ("ROUTING_DATASET", "TOOL_CALL_DATASET"):
+        from . import data
+        return getattr(data, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,19 +2,28 @@
 Backend modules for agent evaluation.
 """
 from .agent_list import build_agents
-from .utils import get_conversation_id, extract_routed_agent_name, extract_tool_calls
+from .utils import (
+    get_conversation_id,
+    get_conversation_id_cached,
+    extract_routed_agent_name,
+    extract_tool_calls,
+)
 from .tools import transfer_funds, pay_bill, update_account_info
+from .openai_client import get_shared_client, close_shared_client
 from .handoff_eval import run_handoff_eval
 from .tool_eval import run_tool_eval
 
 __all__ = [
     "build_agents",
     "get_conversation_id",
+    "get_conversation_id_cached",
     "extract_routed_agent_name",
     "extract_tool_calls",
     "transfer_funds",
     "pay_bill",
     "update_account_info",
+    "get_shared_client",
+    "close_shared_client",
     "run_handoff_eval",
     "run_tool_eval",
 ]
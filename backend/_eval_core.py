@@ -0,0 +1,307 @@
+"""
+Shared evaluation loop used by the handoff and tool call evaluations.
+
+Each case is run against an agent in its own OpenAI-hosted session, scored
+against the expected label on the case, and streamed to a timestamped CSV in
+the results directory. A summary record is appended to the run history.
+"""
+import asyncio
+import csv
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import count
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from agents import Agent, OpenAIConversationsSession
+
+from .history import append_history, build_run_metadata
+from .metrics import summarize
+from .openai_client import get_shared_client
+from .run_cache import cached_run
+from .semantic_cache import SemanticRoutingCache
+
+logger = logging.getLogger(__name__)
+
+CSV_FIELDNAMES = (
+    'run_id',
+    'timestamp',
+    'model',
+    'dataset',
+    'eval_type',
+    'message',
+    'target',
+    'output',
+)
+
+
+def _enable_verbose_logging() -> None:
+    """Route this package's INFO logs to stderr if the app hasn't configured logging."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[logging.StreamHandler()])
+    logging.getLogger(__package__).setLevel(logging.INFO)
+
+
+@contextmanager
+def open_results_csv(
+    metadata: Dict[str, Any],
+    filename_prefix: str,
+    output_dir: Optional[Path] = None,
+) -> Iterator[Tuple[str, Callable[[Dict[str, Any]], None]]]:
+    """
+    Open an evaluation results CSV file for streaming writes.
+
+    The header is written up front and rows are written one at a time as
+    results are produced, so the full result set never has to be buffered.
+
+    Args:
+        metadata: Run metadata to include in the CSV rows
+        filename_prefix: Prefix of the CSV file name (e.g. "handoff_evals")
+        output_dir: Directory to save the CSV file. If None, uses agent_evals/results directory.
+
+    Yields:
+        Tuple of (path to the CSV file, function that writes one result row)
+    """
+    if output_dir is None:
+        # Get the agent_evals root directory (parent of backend)
+        agent_evals_root = Path(__file__).parent.parent
+        output_dir = agent_evals_root / "results"
+
+    # Create output directory if it doesn't exist
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Generate a filename unique to this run. Cached reruns finish well within a
+    # second, so the timestamp goes down to microseconds, and the file is opened
+    # with 'x' so a run never overwrites (or later deletes) another run's file.
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    for attempt in count():
+        suffix = f"_{attempt}" if attempt else ""
+        filepath = output_dir / f"{filename_prefix}_{timestamp}{suffix}.csv"
+        try:
+            csvfile = open(filepath, 'x', newline='', encoding='utf-8', buffering=1 << 16)
+            break
+        except FileExistsError:
+            continue
+
+    # Write CSV file
+    try:
+        with csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(CSV_FIELDNAMES)
+
+            # Metadata columns are identical for every row of a run
+            run_columns = tuple(metadata.get(field, '') for field in CSV_FIELDNAMES[:5])
+
+            def write_row(result: Dict[str, Any]) -> None:
+                writer.writerow(run_columns + (
+                    result.get('message', ''),
+                    result.get('target', ''),
+                    result.get('output', ''),
+                ))
+
+            yield str(filepath), write_row
+    except BaseException:
+        # Don't leave a partial results file behind for a failed run (this call
+        # created the file, so it can't belong to anyone else)
+        filepath.unlink(missing_ok=True)
+        raise
+
+
+async def run_eval(
+    agent: Agent,
+    dataset: Sequence[Any],
+    extract_actual: Callable[[Dict[str, Any]], str],
+    expected_attr: str,
+    *,
+    model: str,
+    dataset_name: str,
+    eval_type: str,
+    filename_prefix: str,
+    label: str,
+    verbose: bool = True,
+    concurrency: int = 16,
+    use_cache: bool = True,
+    semantic_cache: Optional[SemanticRoutingCache] = None,
+    show_all_tools: bool = False,
+) -> Dict[str, Any]:
+    """
+    Run every case of a dataset against an agent and score the outcome.
+
+    Args:
+        agent: Agent that receives each case prompt
+        dataset: Cases with 'case_id', 'prompt' and the expected label attribute
+        extract_actual: Maps a cached_run record to the label compared against the case
+        expected_attr: Name of the case attribute holding the expected label
+        model: Model name the agents were built with
+        dataset_name: Dataset name recorded in the run metadata
+        eval_type: Eval type recorded in the run metadata (e.g. "handoff")
+        filename_prefix: Prefix of the results CSV file name
+        label: Human-readable name of what is scored, used in verbose output
+        verbose: Log per-case progress at INFO level
+        concurrency: Maximum number of cases evaluated at the same time
+        use_cache: Reuse cached agent runs from results/.run_cache
+        semantic_cache: Reuse labels of semantically similar prompts instead of running the agent
+        show_all_tools: Include every tool called in verbose output
+
+    Returns:
+        Dict with 'accuracy', 'correct', 'total', 'cache_hits' (cases scored from a
+        cached outcome instead of a fresh agent run), 'results' (list of test cases),
+        'labels' and 'confusion_matrix' (rows = expected, columns = actual)
+
+    Raises:
+        ValueError: If concurrency is less than 1
+    """
+    # Semaphore(0) would block every case forever
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    if verbose:
+        _enable_verbose_logging()
+    metadata = build_run_metadata(
+        model=model,
+        dataset=dataset_name,
+        eval_type=eval_type,
+    )
+    # One pooled client for all cases (also registered as the Runner default)
+    client = get_shared_client()
+    # Bound the number of in-flight Runner.run calls to respect rate limits
+    sem = asyncio.Semaphore(concurrency)
+
+    # Identical prompts only need one agent run; group cases so each unique
+    # prompt is run once and its outcome is scored against every case using it
+    cases_by_prompt: Dict[str, List[Tuple[int, Any]]] = {}
+    for index, case in enumerate(dataset):
+        cases_by_prompt.setdefault(case.prompt, []).append((index, case))
+
+    async def _run_prompt(prompt: str) -> Tuple[str, Dict[str, Any]]:
+        async with sem:
+            session: Optional[OpenAIConversationsSession] = None
+            record: Dict[str, Any]
+            cached_label = await semantic_cache.lookup(prompt) if semantic_cache else None
+            if cached_label is not None:
+                record = {
+                    "routed_to": None,
+                    "called_tools": [],
+                    "conversation_id": None,
+                    "final_output": None,
+                    "cached": True,
+                }
+                actual = cached_label
+            else:
+                session = OpenAIConversationsSession(openai_client=client)  # OpenAI-hosted storage
+                record = await cached_run(
+                    agent,
+                    prompt,
+                    model,
+                    session,
+                    use_cache=use_cache,
+                )
+                actual = extract_actual(record)
+                if semantic_cache:
+                    await semantic_cache.add(prompt, actual)
+
+            # The stored item count is only reported in verbose output, so the
+            # non-verbose (UI) path makes no extra round-trip. Count while the
+            # session handle is still hot; cached records never touched it.
+            n_items = None
+            if verbose and not record["cached"]:
+                assert session is not None  # only cached records skip the session
+                n_items = len(await session.get_items())
+
+        return prompt, {
+            "actual": actual,
+            "all_tools_called": record["called_tools"],
+            "conversation_id": record["conversation_id"],
+            "n_items": n_items,
+            "final_output": record["final_output"],
+            "cached": record["cached"],
+        }
+
+    # Run unique prompts concurrently, store each in an OpenAI-hosted session,
+    # and score + write the matching cases to the CSV as soon as a run completes
+    if verbose:
+        logger.info("\n=== Generate conversations in OpenAI-hosted Sessions and evaluate %s accuracy ===", label)
+    results: List[Optional[Dict[str, Any]]] = [None] * len(dataset)
+    # Cases scored from a cached outcome (run cache or semantic cache) rather than a fresh agent run
+    cache_hits = 0
+
+    with open_results_csv(metadata, filename_prefix) as (csv_path, write_row):
+        pending = [asyncio.ensure_future(_run_prompt(prompt)) for prompt in cases_by_prompt]
+        try:
+            for next_run in asyncio.as_completed(pending):
+                prompt, run = await next_run
+                for index, case in cases_by_prompt[prompt]:
+                    expected = getattr(case, expected_attr)
+                    is_correct = (run["actual"] == expected)
+
+                    # Build result for UI
+                    result = {
+                        "message": prompt,
+                        "target": expected,
+                        "output": run["actual"],
+                        "correct": is_correct,
+                    }
+                    write_row(result)
+                    cache_hits += run["cached"]
+                    # Rows stream to the CSV in completion order; keep the UI payload in dataset order
+                    results[index] = result
+
+                    if verbose:
+                        status = "✅" if is_correct else "❌"
+                        details = f"items={run['n_items'] if run['n_items'] is not None else 'cached'}"
+                        if show_all_tools:
+                            all_tools_str = ", ".join(run["all_tools_called"]) if run["all_tools_called"] else "None"
+                            details = f"all_tools=[{all_tools_str}] | {details}"
+                        logger.info(
+                            "%s %s | expected=%s, actual=%s | conv_id=%s | %s",
+                            status, case.case_id, expected, run["actual"], run["conversation_id"], details,
+                        )
+        finally:
+            # If a run failed (or the eval was cancelled), stop the remaining runs
+            # rather than letting them keep calling the model in the background
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    if semantic_cache:
+        semantic_cache.save()
+
+    # Every slot is filled once all runs completed
+    scored = [result for result in results if result is not None]
+
+    # Aggregate once over all cases (vectorized when numpy is available)
+    summary = summarize(
+        [result["target"] for result in scored],
+        [result["output"] for result in scored],
+    )
+    correct = summary["correct"]
+    total = len(scored)
+    acc = correct / total if total else 0.0
+
+    history_record = {
+        **metadata,
+        "accuracy": acc,
+        "correct": correct,
+        "total": total,
+        "cache_hits": cache_hits,
+        "csv_path": csv_path,
+    }
+    append_history(history_record)
+    if verbose:
+        logger.info("\nResults saved to: %s", csv_path)
+
+    if verbose:
+        logger.info("\nAccuracy: %d/%d = %.2f%% (%d cached)", correct, total, acc * 100, cache_hits)
+        logger.info("\nDone.")
+        logger.info("Tip: Open Traces to debug incorrect %s results (Tracing is enabled by default).", label)
+
+    return {
+        "accuracy": acc,
+        "correct": correct,
+        "total": total,
+        "cache_hits": cache_hits,
+        "results": scored,
+        "labels": summary["labels"],
+        "confusion_matrix": summary["confusion_matrix"],
+        "csv_path": csv_path,
+        "metadata": metadata,
+    }
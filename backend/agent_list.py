@@ -1,16 +1,36 @@
 """
 Agent definitions: 1 orchestrator + 3 specialists.
 """
+from functools import lru_cache
 from typing import Tuple
 
-from agents import Agent
+from agents import Agent, ModelSettings
 
 from .tools import transfer_funds, pay_bill, update_account_info
 
+# Bump whenever agent instructions or tools change. It is part of the provider
+# prompt cache key and of the run cache key, so edits invalidate both cleanly.
+PROMPT_VERSION = "1"
 
+# Fixed tool order keeps the serialized tool schemas (part of the cached prompt
+# prefix) byte-identical across runs.
+OPERATIONAL_TOOLS = (transfer_funds, pay_bill, update_account_info)
+
+
+def _model_settings(agent_name: str) -> ModelSettings:
+    """Route every call of an agent to the same provider prompt cache."""
+    return ModelSettings(
+        extra_body={"prompt_cache_key": f"{agent_name}-v{PROMPT_VERSION}"},
+    )
+
+
+@lru_cache(maxsize=8)
 def build_agents(model: str = "gpt-4.1-mini") -> Tuple[Agent, Agent, Agent, Agent]:
     """
     Build the orchestrator and specialist agents for banking operations.
+
+    Agents are cached per model: Runner.run only reads agent configuration,
+    so the same instances are safely shared across eval runs and requests.
     
     Returns:
         Tuple of (orchestrator, operational_agent, informational_agent, financial_coach_agent)
@@ -26,7 +46,8 @@ def build_agents(model: str = "gpt-4.1-mini") -> Tuple[Agent, Agent, Agent, Agen
             "Use the available tools to perform operations when the user requests them.\n"
             "If the user is asking general questions about banking services or seeking financial advice, hand off back to the Orchestrator."
         ),
-        tools=[transfer_funds, pay_bill, update_account_info],
+        tools=list(OPERATIONAL_TOOLS),
+        model_settings=_model_settings("Operational"),
     )
 
     informational_agent = Agent(
@@ -38,6 +59,7 @@ def build_agents(model: str = "gpt-4.1-mini") -> Tuple[Agent, Agent, Agent, Agen
             "service descriptions, fees and rates, online banking capabilities, and answering general banking questions.\n"
             "If the user wants to perform a transaction or needs financial coaching/advice, hand off back to the Orchestrator."
         ),
+        model_settings=_model_settings("Informational"),
     )
 
     financial_coach_agent = Agent(
@@ -49,6 +71,7 @@ def build_agents(model: str = "gpt-4.1-mini") -> Tuple[Agent, Agent, Agent, Agen
             "investment guidance, financial goal setting, money management tips, and providing personalized financial coaching.\n"
             "If the user wants to perform a banking operation or ask about banking services/products, hand off back to the Orchestrator."
         ),
+        model_settings=_model_settings("FinancialCoach"),
     )
 
     orchestrator = Agent(
@@ -64,6 +87,7 @@ def build_agents(model: str = "gpt-4.1-mini") -> Tuple[Agent, Agent, Agent, Agen
             "When uncertain, ask ONE short clarifying question, then handoff."
         ),
         handoffs=[operational_agent, informational_agent, financial_coach_agent],
+        model_settings=_model_settings("Orchestrator"),
     )
 
     return orchestrator, operational_agent, informational_agent, financial_coach_agent
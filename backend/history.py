@@ -1,8 +1,11 @@
-import json
+import os
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
 
+import orjson
+
 
 def get_results_dir() -> Path:
     agent_evals_root = Path(__file__).parent.parent
@@ -10,24 +13,70 @@ def get_results_dir() -> Path:
 
 
 def get_history_path() -> Path:
+    return get_results_dir() / "history.jsonl"
+
+
+def get_legacy_history_path() -> Path:
     return get_results_dir() / "history.json"
 
 
+def _with_timestamp(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Every stored record has a 'timestamp' (readers sort on it without a default)."""
+    if "timestamp" in entry:
+        return entry
+    return {**entry, "timestamp": ""}
+
+
+def _migrate_legacy_history() -> None:
+    """
+    Convert a pre-JSONL history.json list into history.jsonl, once.
+
+    Several server processes may race to do this. The converted file is built
+    under a temporary name and published with os.link(), which fails instead of
+    overwriting if another process already created history.jsonl.
+    """
+    legacy_path = get_legacy_history_path()
+    history_path = get_history_path()
+    if history_path.exists() or not legacy_path.exists():
+        return
+    try:
+        with legacy_path.open("rb") as file:
+            entries = orjson.loads(file.read())
+    except FileNotFoundError:
+        return  # another process finished the migration first
+
+    fd, tmp_name = tempfile.mkstemp(dir=history_path.parent, prefix="history.", suffix=".tmp")
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as file:
+            for entry in entries:
+                file.write(orjson.dumps(_with_timestamp(entry), option=orjson.OPT_APPEND_NEWLINE))
+            file.flush()
+            os.fsync(file.fileno())
+        try:
+            os.link(tmp_path, history_path)
+        except FileExistsError:
+            pass  # another process published it (and may already be appending)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    legacy_path.unlink(missing_ok=True)
+
+
 def load_history() -> List[Dict[str, Any]]:
+    _migrate_legacy_history()
     history_path = get_history_path()
     if not history_path.exists():
         return []
-    with history_path.open("r", encoding="utf-8") as file:
-        return json.load(file)
+    with history_path.open("rb") as file:
+        return [orjson.loads(line) for line in file if line.strip()]
 
 
 def append_history(entry: Dict[str, Any]) -> None:
-    history = load_history()
-    history.append(entry)
+    _migrate_legacy_history()
     history_path = get_history_path()
     history_path.parent.mkdir(parents=True, exist_ok=True)
-    with history_path.open("w", encoding="utf-8") as file:
-        json.dump(history, file, indent=2)
+    with history_path.open("ab") as file:
+        file.write(orjson.dumps(_with_timestamp(entry), option=orjson.OPT_APPEND_NEWLINE))
 
 
 def build_run_metadata(model: str, dataset: str, eval_type: str) -> Dict[str, Any]:
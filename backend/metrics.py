@@ -0,0 +1,47 @@
+"""
+Aggregate metrics for evaluation runs.
+"""
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Sequence
+
+# Optional: vectorized aggregation (pure-Python fallback when numpy is not installed)
+np: Optional[ModuleType]
+try:
+    import numpy as np  # type: ignore
+except Exception:
+    np = None  # fallback
+
+
+def summarize(expected: Sequence[str], actual: Sequence[str]) -> Dict[str, Any]:
+    """
+    Score predicted labels against expected labels.
+
+    Returns:
+        Dict with 'correct' (number of exact matches), 'labels' (sorted union of
+        expected and actual labels) and 'confusion_matrix' (rows = expected,
+        columns = actual, indexed like 'labels')
+    """
+    if not expected:
+        return {"correct": 0, "labels": [], "confusion_matrix": []}
+
+    if np is not None:
+        exp = np.asarray(expected, dtype=str)
+        act = np.asarray(actual, dtype=str)
+        unique_labels, inverse = np.unique(np.concatenate([exp, act]), return_inverse=True)
+        n_labels = len(unique_labels)
+        exp_idx, act_idx = inverse[:len(exp)], inverse[len(exp):]
+        counts = np.bincount(exp_idx * n_labels + act_idx, minlength=n_labels * n_labels)
+        return {
+            "correct": int((exp == act).sum()),
+            "labels": unique_labels.tolist(),
+            "confusion_matrix": counts.reshape(n_labels, n_labels).tolist(),
+        }
+
+    labels = sorted(set(expected) | set(actual))
+    index = {label: i for i, label in enumerate(labels)}
+    confusion: List[List[int]] = [[0] * len(labels) for _ in labels]
+    correct = 0
+    for exp_label, act_label in zip(expected, actual):
+        confusion[index[exp_label]][index[act_label]] += 1
+        correct += exp_label == act_label
+    return {"correct": correct, "labels": labels, "confusion_matrix": confusion}
@@ -0,0 +1,82 @@
+"""
+Shared AsyncOpenAI client for agent runs and OpenAI-hosted sessions.
+
+One pooled HTTP client keeps connections alive across the concurrent cases of
+an eval run instead of paying a TLS handshake per request.
+"""
+import asyncio
+import contextlib
+from typing import Optional, Set
+
+import httpx
+from agents import set_default_openai_client
+from openai import AsyncOpenAI
+
+# Optional: HTTP/2 multiplexing (needs the h2 package, installed via httpx[http2])
+try:
+    import h2  # type: ignore  # noqa: F401
+    HTTP2_AVAILABLE = True
+except Exception:
+    HTTP2_AVAILABLE = False  # fallback to HTTP/1.1 keep-alive
+
+_SHARED_CLIENT: Optional[AsyncOpenAI] = None
+_SHARED_LOOP: Optional[asyncio.AbstractEventLoop] = None
+# Strong references to in-flight closes of replaced clients (tasks are weakly held)
+_CLOSING: Set["asyncio.Future[None]"] = set()
+
+
+async def _close_quietly(client: AsyncOpenAI) -> None:
+    # The connections may belong to a loop that has already been closed, in
+    # which case closing them can fail; the pool is released either way
+    with contextlib.suppress(Exception):
+        await client.close()
+
+
+def _close_stale_client(client: AsyncOpenAI, client_loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """Close a client that is being replaced, on its own loop if that loop is still running."""
+    if client_loop is not None and client_loop.is_running():
+        asyncio.run_coroutine_threadsafe(_close_quietly(client), client_loop)
+        return
+    task = asyncio.ensure_future(_close_quietly(client))
+    _CLOSING.add(task)
+    task.add_done_callback(_CLOSING.discard)
+
+
+def get_shared_client() -> AsyncOpenAI:
+    """
+    Return the shared AsyncOpenAI client and register it as the agents SDK default.
+
+    Must be called from within a running event loop. httpx connections are bound
+    to the loop that opened them, so a new client is created (and the old one
+    closed) if the loop changed.
+    """
+    global _SHARED_CLIENT, _SHARED_LOOP
+
+    loop = asyncio.get_running_loop()
+    if _SHARED_CLIENT is None or _SHARED_LOOP is not loop:
+        if _SHARED_CLIENT is not None:
+            # Don't leak the previous loop's connection pool
+            _close_stale_client(_SHARED_CLIENT, _SHARED_LOOP)
+        _SHARED_CLIENT = AsyncOpenAI(
+            http_client=httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                timeout=httpx.Timeout(60.0, connect=5.0),
+            )
+        )
+        _SHARED_LOOP = loop
+        set_default_openai_client(_SHARED_CLIENT)
+    return _SHARED_CLIENT
+
+
+async def close_shared_client() -> None:
+    """
+    Close the shared client and its connection pool, if one was created on the
+    running loop. A client bound to another loop is left to that loop's owner.
+    """
+    global _SHARED_CLIENT, _SHARED_LOOP
+
+    if _SHARED_CLIENT is None or _SHARED_LOOP is not asyncio.get_running_loop():
+        return
+    client, _SHARED_CLIENT, _SHARED_LOOP = _SHARED_CLIENT, None, None
+    await _close_quietly(client)
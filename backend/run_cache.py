@@ -0,0 +1,141 @@
+"""
+Disk-backed cache for Runner.run results.
+
+Evaluations replay the same prompts against the same agents over and over while
+iterating on the app. Each run is keyed by the model, agent and prompt, and only
+the fields the evals score on are persisted, so a cache hit skips the LLM call
+entirely.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from agents import Agent, Runner, OpenAIConversationsSession
+
+from .agent_list import PROMPT_VERSION
+from .history import get_results_dir
+from .utils import (
+    get_conversation_id,
+    get_conversation_id_cached,
+    extract_routed_agent_name,
+    extract_tool_calls,
+)
+
+logger = logging.getLogger(__name__)
+
+# Fields every cached record must have; anything else is treated as a miss
+_RECORD_FIELDS = frozenset({"routed_to", "called_tools", "final_output", "conversation_id"})
+
+
+def get_run_cache_dir() -> Path:
+    return get_results_dir() / ".run_cache"
+
+
+def _agent_fingerprint(agent: Agent) -> Dict[str, Any]:
+    """Collect the parts of an agent definition that influence its output."""
+    return {
+        "name": agent.name,
+        "instructions": agent.instructions if isinstance(agent.instructions, str) else None,
+        "tools": [
+            {
+                "name": getattr(tool, "name", None),
+                "schema": getattr(tool, "params_json_schema", None),
+            }
+            for tool in agent.tools
+        ],
+        "handoffs": [getattr(handoff, "name", None) for handoff in agent.handoffs],
+    }
+
+
+def _read_cached_record(cache_path: Path) -> Optional[Dict[str, Any]]:
+    """Return the cached record at cache_path, or None if it is missing or unusable."""
+    try:
+        with cache_path.open("r", encoding="utf-8") as file:
+            record = json.load(file)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:  # json.JSONDecodeError is a ValueError
+        logger.warning("Ignoring unreadable run cache entry %s: %s", cache_path.name, e)
+        return None
+    if not isinstance(record, dict) or not _RECORD_FIELDS <= record.keys():
+        logger.warning("Ignoring incomplete run cache entry %s", cache_path.name)
+        return None
+    return record
+
+
+def _write_cached_record(cache_path: Path, record: Dict[str, Any]) -> None:
+    """Write a record atomically, so readers never see a partially written file."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=f"{cache_path.stem}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(record, file, default=str)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def build_cache_key(agent: Agent, prompt: str, model: str) -> str:
+    """Compute the SHA256 cache key for a (model, agent, prompt) triple."""
+    payload = json.dumps(
+        {
+            "model": model,
+            "prompt_version": PROMPT_VERSION,
+            "agent": _agent_fingerprint(agent),
+            "prompt": prompt,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+async def cached_run(
+    agent: Agent,
+    prompt: str,
+    model: str,
+    session: OpenAIConversationsSession,
+    use_cache: bool = True,
+) -> Dict[str, Any]:
+    """
+    Run an agent on a prompt, reusing a previously stored result when available.
+
+    Args:
+        agent: Agent to run
+        prompt: User prompt
+        model: Model name the agent was built with
+        session: Session used when the run is not cached
+        use_cache: Read from and write to the on-disk cache
+
+    Returns:
+        Dict with 'routed_to', 'called_tools', 'final_output', 'conversation_id'
+        and 'cached' (whether the record came from the cache)
+    """
+    cache_path = get_run_cache_dir() / f"{build_cache_key(agent, prompt, model)}.json"
+    if use_cache:
+        record = _read_cached_record(cache_path)
+        if record is not None:
+            record["cached"] = True
+            return record
+
+    result = await Runner.run(agent, prompt, session=session)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s new_items: %s", agent.name, result.new_items)
+    record = {
+        "routed_to": extract_routed_agent_name(result),
+        "called_tools": extract_tool_calls(result),
+        "final_output": result.final_output,
+        # After a run the session ID is normally set already; only await on a miss
+        "conversation_id": get_conversation_id_cached(session) or await get_conversation_id(session),
+    }
+
+    if use_cache:
+        _write_cached_record(cache_path, record)
+
+    record["cached"] = False
+    return record
@@ -0,0 +1,153 @@
+"""
+Semantic cache for routing decisions.
+
+Paraphrased prompts nearly always route to the same specialist, so a local
+sentence-embedding lookup can stand in for the orchestrator's LLM call. Prompts
+are embedded with sentence-transformers and matched by cosine similarity in a
+FAISS inner-product index over L2-normalized vectors.
+
+Optional dependencies:
+  pip install sentence-transformers faiss-cpu
+"""
+import asyncio
+import json
+import logging
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .agent_list import PROMPT_VERSION
+from .history import get_results_dir
+
+# Optional: embedding + vector index (only needed when the semantic cache is enabled)
+try:
+    import faiss  # type: ignore
+    from sentence_transformers import SentenceTransformer  # type: ignore
+except Exception:
+    faiss = None  # fallback
+    SentenceTransformer = None  # fallback
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+DEFAULT_THRESHOLD = 0.92
+
+
+def get_semantic_cache_dir() -> Path:
+    return get_results_dir() / ".semantic_cache"
+
+
+@lru_cache(maxsize=None)
+def _get_encoder(embedding_model: str) -> Any:
+    """Load a sentence-transformers model once per process and reuse it across evals."""
+    return SentenceTransformer(embedding_model)
+
+
+def _write_atomically(path: Path, write: Callable[[str], None]) -> None:
+    """Call write() on a temp file next to path, then move it into place in one step."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+class SemanticRoutingCache:
+    """
+    Map prompts to previously observed routing labels by embedding similarity.
+
+    The index is scoped to one eval model and PROMPT_VERSION, since a routing
+    decision is only reusable for the agents that produced it.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        threshold: float = DEFAULT_THRESHOLD,
+        embedding_model: str = DEFAULT_EMBEDDING_MODEL,
+        cache_dir: Optional[Path] = None,
+    ) -> None:
+        if faiss is None or SentenceTransformer is None:
+            raise ImportError(
+                "The semantic cache requires sentence-transformers and faiss: "
+                "pip install sentence-transformers faiss-cpu"
+            )
+
+        self.threshold = threshold
+        cache_dir = cache_dir or get_semantic_cache_dir()
+        stem = f"{model}-v{PROMPT_VERSION}".replace("/", "_")
+        self.index_path = cache_dir / f"{stem}.faiss"
+        self.labels_path = cache_dir / f"{stem}.json"
+
+        self._encoder = _get_encoder(embedding_model)
+        dim = self._encoder.get_sentence_embedding_dimension()
+        self._pending: Dict[str, Any] = {}
+
+        loaded = self._load()
+        if loaded is not None:
+            self._index, self._labels = loaded
+        else:
+            self._index = faiss.IndexFlatIP(dim)
+            self._labels = []
+
+    def _load(self) -> Optional[Tuple[Any, List[str]]]:
+        """Read the stored index and labels, or None if they are missing or don't match."""
+        if not (self.index_path.exists() and self.labels_path.exists()):
+            return None
+        try:
+            index = faiss.read_index(str(self.index_path))
+            with self.labels_path.open("r", encoding="utf-8") as file:
+                labels = json.load(file)
+        except (OSError, ValueError, RuntimeError) as e:  # faiss raises RuntimeError
+            logger.warning("Ignoring unreadable semantic cache %s: %s", self.index_path.name, e)
+            return None
+        # The two files are saved one after the other; a crash in between leaves
+        # them out of step, and lookups would index past the end of the labels
+        if not isinstance(labels, list) or len(labels) != index.ntotal:
+            logger.warning("Ignoring semantic cache %s: index and labels don't match", self.index_path.name)
+            return None
+        return index, labels
+
+    def _embed(self, prompt: str) -> Any:
+        return self._encoder.encode([prompt], normalize_embeddings=True).astype("float32")
+
+    async def _embed_async(self, prompt: str) -> Any:
+        # Encoding is CPU-bound; run it in a worker thread so the event loop
+        # keeps serving the other cases. Index reads/writes stay on the loop.
+        return await asyncio.to_thread(self._embed, prompt)
+
+    async def lookup(self, prompt: str) -> Optional[str]:
+        """Return the stored label of the closest prompt above the threshold, if any."""
+        query = await self._embed_async(prompt)
+        if self._index.ntotal:
+            scores, ids = self._index.search(query, 1)
+            if scores[0][0] >= self.threshold:
+                return self._labels[ids[0][0]]
+        # Keep the embedding so a following add() does not re-encode the prompt
+        self._pending[prompt] = query
+        return None
+
+    async def add(self, prompt: str, label: str) -> None:
+        """Record the routing label observed for a prompt."""
+        query = self._pending.pop(prompt, None)
+        if query is None:
+            query = await self._embed_async(prompt)
+        self._index.add(query)
+        self._labels.append(label)
+
+    def save(self) -> None:
+        """Persist the index and its labels."""
+        def write_labels(tmp_path: str) -> None:
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(self._labels, file)
+
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        # Each file is replaced atomically, so concurrent evals never read a
+        # half-written one; the last save wins
+        _write_atomically(self.index_path, lambda tmp_path: faiss.write_index(self._index, tmp_path))
+        _write_atomically(self.labels_path, write_labels)
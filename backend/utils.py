@@ -1,17 +1,40 @@
 """
 Utility functions for agent evaluation.
 """
-from typing import List
+import sys
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from agents import OpenAIConversationsSession
 
-# Optional: types for introspection (best-effort; SDK exports may vary by version)
+# Optional: types for introspection (best-effort; SDK exports may vary by version).
+# Each type is resolved on its own, so one name missing from the installed SDK
+# doesn't disable the fast paths for the others.
+_sdk_items: Optional[ModuleType]
 try:
-    from agents.items import HandoffOutputItem, FunctionCallOutputItem, ToolCallItem  # type: ignore
+    from agents import items as _sdk_items
 except Exception:
-    HandoffOutputItem = None  # fallback
-    FunctionCallOutputItem = None  # fallback
-    ToolCallItem = None  # fallback
+    _sdk_items = None  # fallback
+
+HandoffOutputItem = getattr(_sdk_items, "HandoffOutputItem", None)
+FunctionCallOutputItem = getattr(_sdk_items, "FunctionCallOutputItem", None)
+ToolCallItem = getattr(_sdk_items, "ToolCallItem", None)
+
+# Sentinel for attributes that may legitimately be None
+_MISSING: object = object()
+
+# Resolved once at import: isinstance() against an empty tuple is always False,
+# so the hot loop needs no "is the SDK type available" check per item.
+_HANDOFF_TYPES: Tuple[type, ...] = (HandoffOutputItem,) if HandoffOutputItem is not None else ()
+
+
+def get_conversation_id_cached(session: OpenAIConversationsSession) -> Optional[str]:
+    """
+    Return the session's conversation ID if it is already known, without awaiting.
+    Callers fall back to get_conversation_id() when this returns None.
+    """
+    # Common patterns across SDK versions:
+    return getattr(session, "_session_id", None) or None
 
 
 async def get_conversation_id(session: OpenAIConversationsSession) -> str:
@@ -19,30 +42,33 @@ async def get_conversation_id(session: OpenAIConversationsSession) -> str:
     OpenAIConversationsSession supports resuming via conversation_id (see Sessions docs).
     SDK versions differ slightly; this tries a few ways.
     """
-    # Common patterns across SDK versions:
-    if hasattr(session, "_session_id") and getattr(session, "_session_id"):
-        return getattr(session, "_session_id")
+    conversation_id = get_conversation_id_cached(session)
+    if conversation_id:
+        return conversation_id
     
     # Otherwise, call _get_session_id() which will get/create the session ID
     return await session._get_session_id()  # type: ignore
 
 
-def extract_routed_agent_name(run_result) -> str:
+def extract_routed_agent_name(run_result: Any) -> str:
     """
     Detect which agent was selected by inspecting RunResult.new_items.
-    HandoffOutputItem contains source/target agent info.
+    HandoffOutputItem contains source/target agent info. If the run handed
+    off more than once, the most recent handoff wins.
     """
-    # Preferred: look for HandoffOutputItem in new_items
-    for item in getattr(run_result, "new_items", []) or []:
-        # If we can import HandoffOutputItem, use isinstance
-        if HandoffOutputItem is not None:
-            if isinstance(item, HandoffOutputItem):
-                # The SDK exposes source/target agents on the item.
-                target = getattr(item, "target_agent", None)
-                if target is not None:
-                    return getattr(target, "name", "Unknown")
-                # fallback
-                return "Unknown"
+    handoff_types = _HANDOFF_TYPES  # local binding for the loop
+
+    # Preferred: look for HandoffOutputItem in new_items. Handoffs sit near the
+    # end of the item list, so scan from the back and stop at the first hit.
+    for item in reversed(getattr(run_result, "new_items", None) or ()):
+        # If we could import HandoffOutputItem, use isinstance
+        if isinstance(item, handoff_types):
+            # The SDK exposes source/target agents on the item.
+            target = getattr(item, "target_agent", None)
+            if target is not None:
+                return getattr(target, "name", "Unknown")
+            # fallback
+            return "Unknown"
 
         # Best-effort fallback: check attributes that look like a handoff item
         if hasattr(item, "target_agent"):
@@ -54,94 +80,86 @@ def extract_routed_agent_name(run_result) -> str:
     return getattr(last_agent, "name", "Unknown")
 
 
-def extract_tool_calls(run_result) -> List[str]:
+def _raw_item_name(item: Any) -> Optional[str]:
+    raw_item = getattr(item, "raw_item", None)
+    return getattr(raw_item, "name", None) if raw_item else None
+
+
+def _attribute_tool_name(item: Any) -> Optional[str]:
+    """Probe the attributes tool-call-like items expose across SDK versions."""
+    # Fallback: check for function_call or tool_call attributes
+    func_call = getattr(item, "function_call", None) or getattr(item, "tool_call", None)
+    tool_name = getattr(func_call, "name", None) if func_call else None
+    if tool_name:
+        return tool_name
+    
+    # Alternative: check for function_name directly on the item
+    tool_name = getattr(item, "function_name", None)
+    if tool_name:
+        return tool_name
+    
+    # Last resort: check for name attribute on callable items
+    # (avoid picking up handoff items, which carry a target_agent)
+    if getattr(item, "target_agent", _MISSING) is _MISSING:
+        return getattr(item, "name", None)
+    return None
+
+
+def _generic_tool_name(item: Any) -> Optional[str]:
+    # Fallback: check for type attribute indicating tool_call_item
+    if getattr(item, "type", None) == "tool_call_item":
+        tool_name = _raw_item_name(item)
+        if tool_name:
+            return tool_name
+    return _attribute_tool_name(item)
+
+
+def _tool_call_item_name(item: Any) -> Optional[str]:
+    # ToolCallItem (new format with raw_item)
+    return _raw_item_name(item) or _generic_tool_name(item)
+
+
+def _function_call_output_item_name(item: Any) -> Optional[str]:
+    # The SDK exposes function/tool info on the item
+    return (
+        getattr(item, "function_name", None)
+        or getattr(item, "name", None)
+        or _attribute_tool_name(item)
+    )
+
+
+# Exact item type -> tool name extractor, resolved once at import for the SDK
+# types that could be imported. Anything else goes through _generic_tool_name.
+_TOOL_NAME_EXTRACTORS: Dict[type, Callable[[Any], Optional[str]]] = {}
+if ToolCallItem is not None:
+    _TOOL_NAME_EXTRACTORS[ToolCallItem] = _tool_call_item_name
+if FunctionCallOutputItem is not None:
+    _TOOL_NAME_EXTRACTORS[FunctionCallOutputItem] = _function_call_output_item_name
+
+
+def extract_tool_calls(run_result: Any) -> List[str]:
     """
     Extract the names of tools that were called during the run.
     
     Returns:
         List of tool names that were called (e.g., ["transfer_funds", "pay_bill"])
     """
-    tool_calls = []
-    seen_tools = set()  # Track to avoid duplicates
+    tool_calls: List[str] = []
+    seen_tools: Set[str] = set()  # Track to avoid duplicates
     
-    # Check new_items for tool calls
-    for item in getattr(run_result, "new_items", []) or []:
-        tool_name = None
-        
-        # First, check for ToolCallItem (new format with raw_item)
-        if ToolCallItem is not None:
-            if isinstance(item, ToolCallItem):
-                raw_item = getattr(item, "raw_item", None)
-                if raw_item:
-                    tool_name = getattr(raw_item, "name", None)
-        
-        # Fallback: check for type attribute indicating tool_call_item
+    # all_items (where the SDK provides it) already contains new_items, so scan
+    # whichever is the most complete list exactly once
+    items = getattr(run_result, "all_items", None) or getattr(run_result, "new_items", None) or ()
+    for item in items:
+        extractor = _TOOL_NAME_EXTRACTORS.get(item.__class__, _generic_tool_name)
+        tool_name = extractor(item)
         if not tool_name:
-            item_type = getattr(item, "type", None)
-            if item_type == "tool_call_item":
-                raw_item = getattr(item, "raw_item", None)
-                if raw_item:
-                    tool_name = getattr(raw_item, "name", None)
-        
-        # Preferred: use FunctionCallOutputItem if available
-        if not tool_name and FunctionCallOutputItem is not None:
-            if isinstance(item, FunctionCallOutputItem):
-                # The SDK exposes function/tool info on the item
-                tool_name = getattr(item, "function_name", None) or getattr(item, "name", None)
-        
-        # Fallback: check for function_call or tool_call attributes
-        if not tool_name and (hasattr(item, "function_call") or hasattr(item, "tool_call")):
-            func_call = getattr(item, "function_call", None) or getattr(item, "tool_call", None)
-            if func_call:
-                tool_name = getattr(func_call, "name", None)
-        
-        # Alternative: check for function_name directly on the item
-        if not tool_name and hasattr(item, "function_name"):
-            tool_name = getattr(item, "function_name")
-        
-        # Last resort: check for name attribute on callable items
-        if not tool_name and hasattr(item, "name") and not hasattr(item, "target_agent"):
-            # Avoid picking up handoff items
-            tool_name = getattr(item, "name", None)
-        
-        if tool_name and tool_name not in seen_tools:
-            tool_calls.append(tool_name)
-            seen_tools.add(tool_name)
-    
-    # Also check all_items if available (for completeness)
-    for item in getattr(run_result, "all_items", []) or []:
-        tool_name = None
-        
-        # First, check for ToolCallItem (new format with raw_item)
-        if ToolCallItem is not None:
-            if isinstance(item, ToolCallItem):
-                raw_item = getattr(item, "raw_item", None)
-                if raw_item:
-                    tool_name = getattr(raw_item, "name", None)
-        
-        # Fallback: check for type attribute indicating tool_call_item
-        if not tool_name:
-            item_type = getattr(item, "type", None)
-            if item_type == "tool_call_item":
-                raw_item = getattr(item, "raw_item", None)
-                if raw_item:
-                    tool_name = getattr(raw_item, "name", None)
-        
-        if not tool_name and FunctionCallOutputItem is not None:
-            if isinstance(item, FunctionCallOutputItem):
-                tool_name = getattr(item, "function_name", None) or getattr(item, "name", None)
-        
-        if not tool_name and (hasattr(item, "function_call") or hasattr(item, "tool_call")):
-            func_call = getattr(item, "function_call", None) or getattr(item, "tool_call", None)
-            if func_call:
-                tool_name = getattr(func_call, "name", None)
-        
-        if not tool_name and hasattr(item, "function_name"):
-            tool_name = getattr(item, "function_name")
-        
-        if tool_name and tool_name not in seen_tools:
+            continue
+        # Tool names come from a small fixed set; interning lets set lookups and
+        # later comparisons against the (interned) expected labels hit identity
+        tool_name = sys.intern(tool_name)
+        if tool_name not in seen_tools:
             tool_calls.append(tool_name)
             seen_tools.add(tool_name)
     
     return tool_calls
-
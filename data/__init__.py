@@ -1,12 +1,21 @@
 """
 Data modules and datasets for agent evaluation.
 """
-from .dataset import RoutingCase, ROUTING_DATASET, ToolCallCase, TOOL_CALL_DATASET
+from . import dataset
+from .dataset import RoutingCase, ToolCallCase, iter_routing_rows, iter_tool_call_rows
 
 __all__ = [
     "RoutingCase",
     "ROUTING_DATASET",
     "ToolCallCase",
     "TOOL_CALL_DATASET",
+    "iter_routing_rows",
+    "iter_tool_call_rows",
 ]
 
+
+def __getattr__(name: str):
+    # ROUTING_DATASET / TOOL_CALL_DATASET are loaded lazily by data.dataset
+    if name in ("ROUTING_DATASET", "TOOL_CALL_DATASET"):
+        return getattr(dataset, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
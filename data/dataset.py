@@ -2,19 +2,23 @@
 Dataset for routing evaluation and tool call evaluation.
 """
 import csv
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Tuple
 
+_ROUTING_CSV = "routing_dataset.csv"
+_TOOL_CALL_CSV = "tool_call_dataset.csv"
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class RoutingCase:
     case_id: str
     prompt: str
     expected_agent: str  # "Operational", "Informational", or "FinancialCoach"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolCallCase:
     case_id: str
     prompt: str
@@ -26,44 +30,69 @@ def _get_dataset_dir() -> Path:
     return Path(__file__).parent
 
 
+def _iter_csv_cases(csv_path: Path, expected_column: str) -> Iterator[Tuple[str, str, str]]:
+    """Yield (case_id, prompt, expected) for each row of a dataset CSV file."""
+    with open(csv_path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        # next() would raise StopIteration here, which a generator turns into RuntimeError
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"Dataset file {csv_path.name} is empty")
+        missing = [column for column in ("case_id", "prompt", expected_column) if column not in header]
+        if missing:
+            raise ValueError(f"Dataset file {csv_path.name} is missing column(s): {', '.join(missing)}")
+        ci = header.index("case_id")
+        pi = header.index("prompt")
+        ei = header.index(expected_column)
+        for row in reader:
+            if row:
+                yield row[ci], row[pi], row[ei]
+
+
 def _load_routing_dataset(csv_path: Path) -> List[RoutingCase]:
     """Load routing dataset from CSV file."""
-    cases = []
-    with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            cases.append(
-                RoutingCase(
-                    case_id=row["case_id"],
-                    prompt=row["prompt"],
-                    expected_agent=row["expected_agent"],
-                )
-            )
-    return cases
+    return [
+        RoutingCase(case_id, prompt, sys.intern(expected))
+        for case_id, prompt, expected in _iter_csv_cases(csv_path, "expected_agent")
+    ]
 
 
 def _load_tool_call_dataset(csv_path: Path) -> List[ToolCallCase]:
     """Load tool call dataset from CSV file."""
-    cases = []
-    with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            cases.append(
-                ToolCallCase(
-                    case_id=row["case_id"],
-                    prompt=row["prompt"],
-                    expected_tool=row["expected_tool"],
-                )
-            )
-    return cases
-
-
-# Load datasets from CSV files
-_dataset_dir = _get_dataset_dir()
-ROUTING_DATASET: List[RoutingCase] = _load_routing_dataset(
-    _dataset_dir / "routing_dataset.csv"
-)
-TOOL_CALL_DATASET: List[ToolCallCase] = _load_tool_call_dataset(
-    _dataset_dir / "tool_call_dataset.csv"
-)
+    return [
+        ToolCallCase(case_id, prompt, sys.intern(expected))
+        for case_id, prompt, expected in _iter_csv_cases(csv_path, "expected_tool")
+    ]
+
+
+def _iter_example_rows(filename: str, expected_column: str) -> Iterator[Dict[str, str]]:
+    for case_id, prompt, expected in _iter_csv_cases(_get_dataset_dir() / filename, expected_column):
+        yield {"case_id": case_id, "prompt": prompt, "expected": expected}
+
+
+def iter_routing_rows() -> Iterator[Dict[str, str]]:
+    """Stream routing cases from the CSV as {'case_id', 'prompt', 'expected'} dicts."""
+    return _iter_example_rows(_ROUTING_CSV, "expected_agent")
+
+
+def iter_tool_call_rows() -> Iterator[Dict[str, str]]:
+    """Stream tool call cases from the CSV as {'case_id', 'prompt', 'expected'} dicts."""
+    return _iter_example_rows(_TOOL_CALL_CSV, "expected_tool")
+
+
+# Datasets are parsed from their CSV files on first access (PEP 562), so
+# importing this module stays cheap and each eval only loads the dataset it uses.
+_DATASET_LOADERS = {
+    "ROUTING_DATASET": (_load_routing_dataset, _ROUTING_CSV),
+    "TOOL_CALL_DATASET": (_load_tool_call_dataset, _TOOL_CALL_CSV),
+}
+
 
+def __getattr__(name: str):
+    if name in _DATASET_LOADERS:
+        loader, filename = _DATASET_LOADERS[name]
+        value = loader(_get_dataset_dir() / filename)
+        # Cache as a real module global; later lookups never reach __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,9 +2,17 @@
 Flask web application for running agent evaluations.
 """
 import asyncio
+import atexit
+import contextlib
+import os
 import sys
+import threading
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from flask import Flask, render_template, jsonify, request
+from typing import Any, Dict, List, Optional, Tuple
+import orjson
+from flask import Flask, Response, render_template, jsonify, request
 from flask_cors import CORS
 
 # Ensure the agent_evals root is on sys.path for imports
@@ -13,9 +21,10 @@ if str(agent_evals_root) not in sys.path:
     sys.path.insert(0, str(agent_evals_root))
 
 from backend.handoff_eval import run_handoff_eval
-from backend.history import load_history
+from backend.history import get_history_path, load_history
+from backend.openai_client import close_shared_client
 from backend.tool_eval import run_tool_eval
-from data.dataset import ROUTING_DATASET, TOOL_CALL_DATASET
+from data import dataset
 
 # Set template folder explicitly to frontend/templates
 template_dir = Path(__file__).parent / "templates"
@@ -24,6 +33,76 @@ app = Flask(__name__, template_folder=str(template_dir))
 CORS(app, resources={r"/*": {"origins": "*"}})
 
 
+DEFAULT_CONCURRENCY = 16
+
+# One long-lived event loop for all eval requests, so the shared OpenAI client
+# and its connection pool stay warm between evaluations. It is started on the
+# first eval request, so importing the app doesn't spawn a thread.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the background eval loop, starting it on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="eval-loop", daemon=True).start()
+            atexit.register(_shutdown_loop, loop)
+            _loop = loop
+        return _loop
+
+
+def _run_eval(coro):
+    """Run an evaluation coroutine on the background loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+def _shutdown_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Close the eval loop's pooled connections before the interpreter exits."""
+    if loop.is_running():
+        # close_shared_client() only closes a client created on this loop and
+        # swallows close errors, so exit stays quiet
+        with contextlib.suppress(Exception):
+            asyncio.run_coroutine_threadsafe(close_shared_client(), loop).result(timeout=5)
+        loop.call_soon_threadsafe(loop.stop)
+
+
+def _parse_concurrency(value: Any) -> Optional[int]:
+    """Return the requested concurrency as a positive int (default if omitted), or None if it isn't one."""
+    if value is None:
+        return DEFAULT_CONCURRENCY
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        return None
+    try:
+        concurrency = int(value)
+    except ValueError:
+        return None
+    return concurrency if concurrency >= 1 else None
+
+
+def _parse_use_cache(value: Any) -> Optional[bool]:
+    """Return the requested use_cache flag (default True), or None if it isn't a boolean."""
+    if value is None:
+        return True
+    return value if isinstance(value, bool) else None
+
+
+def _invalid_concurrency_response():
+    return jsonify({
+        "success": False,
+        "error": "'concurrency' must be a positive integer",
+    }), 400
+
+
+def _invalid_use_cache_response():
+    return jsonify({
+        "success": False,
+        "error": "'use_cache' must be true or false",
+    }), 400
+
+
 @app.route("/")
 def index():
     """Serve the main UI page."""
@@ -34,11 +113,24 @@ def index():
 def api_run_handoff_eval():
     """Run handoff evaluation and return results."""
     try:
-        data = request.get_json() or {}
+        data = request.get_json(silent=True) or {}
         model = data.get("model", "gpt-4.1-mini")
+        # Maximum number of cases the backend runs at the same time
+        concurrency = _parse_concurrency(data.get("concurrency"))
+        if concurrency is None:
+            return _invalid_concurrency_response()
+        # use_cache=false forces fresh agent runs instead of replaying cached outcomes
+        use_cache = _parse_use_cache(data.get("use_cache"))
+        if use_cache is None:
+            return _invalid_use_cache_response()
         
         # Run the async evaluation
-        result = asyncio.run(run_handoff_eval(model=model, verbose=False))
+        result = _run_eval(run_handoff_eval(
+            model=model,
+            verbose=False,
+            concurrency=concurrency,
+            use_cache=use_cache,
+        ))
         
         return jsonify({
             "success": True,
@@ -55,11 +147,24 @@ def api_run_handoff_eval():
 def api_run_tool_eval():
     """Run tool call evaluation and return results."""
     try:
-        data = request.get_json() or {}
+        data = request.get_json(silent=True) or {}
         model = data.get("model", "gpt-4.1-mini")
+        # Maximum number of cases the backend runs at the same time
+        concurrency = _parse_concurrency(data.get("concurrency"))
+        if concurrency is None:
+            return _invalid_concurrency_response()
+        # use_cache=false forces fresh agent runs instead of replaying cached outcomes
+        use_cache = _parse_use_cache(data.get("use_cache"))
+        if use_cache is None:
+            return _invalid_use_cache_response()
         
         # Run the async evaluation
-        result = asyncio.run(run_tool_eval(model=model, verbose=False))
+        result = _run_eval(run_tool_eval(
+            model=model,
+            verbose=False,
+            concurrency=concurrency,
+            use_cache=use_cache,
+        ))
         
         return jsonify({
             "success": True,
@@ -72,16 +177,44 @@ def api_run_tool_eval():
         }), 500
 
 
+# (mtime_ns, size) of history.jsonl -> newest-first history parsed from it
+_history_cache: Tuple[Optional[Tuple[int, int]], List[Dict[str, Any]]] = (None, [])
+
+
+def _sorted_history() -> List[Dict[str, Any]]:
+    """
+    Load the history newest-first, reusing the last result while the file is unchanged.
+
+    The returned list (and its records) is shared between requests; treat it as read-only.
+    """
+    global _history_cache
+    try:
+        stat = get_history_path().stat()
+        file_key = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        file_key = None  # nothing written yet (or a legacy file still to migrate)
+
+    cached_key, cached_history = _history_cache
+    if file_key is not None and file_key == cached_key:
+        return cached_history
+
+    history_sorted = sorted(
+        load_history(),
+        # history.py guarantees a 'timestamp' on every record it writes or migrates
+        key=itemgetter("timestamp"),
+        reverse=True,
+    )
+    if file_key is not None:
+        # Rebind in one assignment so concurrent readers see a consistent pair
+        _history_cache = (file_key, history_sorted)
+    return history_sorted
+
+
 @app.route("/api/history", methods=["GET"])
 def api_history():
     """Return stored evaluation history."""
     try:
-        history = load_history()
-        history_sorted = sorted(
-            history,
-            key=lambda record: record.get("timestamp", ""),
-            reverse=True,
-        )
+        history_sorted = _sorted_history()
         return jsonify({
             "success": True,
             "data": history_sorted,
@@ -93,33 +226,26 @@ def api_history():
         }), 500
 
 
+# The dataset files don't change while the app runs, so each example payload is
+# streamed straight from its CSV and serialized on first request, then reused.
+@lru_cache(maxsize=None)
+def _tool_examples_body() -> bytes:
+    return orjson.dumps({"success": True, "data": list(dataset.iter_tool_call_rows())})
+
+
+@lru_cache(maxsize=None)
+def _routing_examples_body() -> bytes:
+    return orjson.dumps({"success": True, "data": list(dataset.iter_routing_rows())})
+
+
 @app.route("/api/examples", methods=["GET"])
 def api_examples():
     """Return evaluation examples for the selected type."""
     try:
         eval_type = request.args.get("eval_type", "handoff")
-        if eval_type == "tool":
-            examples = [
-                {
-                    "case_id": case.case_id,
-                    "prompt": case.prompt,
-                    "expected": case.expected_tool,
-                }
-                for case in TOOL_CALL_DATASET
-            ]
-        else:
-            examples = [
-                {
-                    "case_id": case.case_id,
-                    "prompt": case.prompt,
-                    "expected": case.expected_agent,
-                }
-                for case in ROUTING_DATASET
-            ]
-        return jsonify({
-            "success": True,
-            "data": examples,
-        })
+        # The first request per type reads the dataset CSV, which can fail
+        body = _tool_examples_body() if eval_type == "tool" else _routing_examples_body()
+        return Response(body, mimetype="application/json")
     except Exception as e:
         return jsonify({
             "success": False,
@@ -128,4 +254,5 @@ def api_examples():
 
 
 if __name__ == "__main__":
-    app.run(debug=True, host='127.0.0.1', port=5001)
+    # Only enable the Werkzeug debugger in development (as run_app.py does)
+    app.run(debug=os.environ.get("FLASK_ENV") == "development", host='127.0.0.1', port=5001)
@@ -0,0 +1,23 @@
+"""
+Gunicorn configuration for serving the Flask app.
+
+Used by run_app.py; can also be passed directly:
+    gunicorn -c gunicorn_conf.py frontend.app:app
+"""
+import os
+from multiprocessing import cpu_count
+
+bind = os.environ.get("GUNICORN_BIND", "127.0.0.1:5001")
+workers = int(os.environ.get("GUNICORN_WORKERS", cpu_count()))
+
+# Threaded workers: an eval request blocks its thread on the worker's background
+# asyncio loop while other threads keep serving /api/history and /api/examples.
+# (gevent workers would monkey-patch threading and break that loop thread.)
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 8))
+
+# Evaluations run for minutes; don't cut long requests off at the default 30s
+timeout = 600
+
+# Each worker must import the app itself so it starts its own event loop thread
+preload_app = False
@@ -4,6 +4,7 @@ Entry point script to run the Flask application.
 This allows running the app directly without module path issues.
 Run this from within the agent_evals folder.
 """
+import os
 from pathlib import Path
 import sys
 
@@ -15,10 +16,18 @@ AGENT_EVALS_ROOT = THIS_FILE.parent
 if str(AGENT_EVALS_ROOT) not in sys.path:
     sys.path.insert(0, str(AGENT_EVALS_ROOT))
 
-from frontend.app import app
-
 
 if __name__ == "__main__":
-    app.run(debug=True, host='127.0.0.1', port=5001)
-
-
+    if os.environ.get("FLASK_ENV") == "development":
+        # Werkzeug dev server with the debugger and auto-reload
+        from frontend.app import app
+
+        app.run(debug=True, host='127.0.0.1', port=5001)
+    else:
+        # Production: hand the process over to gunicorn (see gunicorn_conf.py)
+        os.execv(sys.executable, [
+            sys.executable, "-m", "gunicorn",
+            "--chdir", str(AGENT_EVALS_ROOT),
+            "-c", str(AGENT_EVALS_ROOT / "gunicorn_conf.py"),
+            "frontend.app:app",
+        ])